@@ -1,16 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, overload
+
 import click
-import geopandas as gpd
 from rich.console import Console
-from rich.table import Table
-from shapely.geometry import box
 
-from compare_regions_jp.data.railway import RailwayDataLoader
+if TYPE_CHECKING:
+    import geopandas as gpd
+    import numpy as np
 
 console = Console()
 
 
 def load_railway_data() -> gpd.GeoDataFrame:
     """鉄道データを読み込む."""
+    # 重い依存（geopandas等）はデータを実際に扱う時点で初めてインポートする
+    import pandas as pd
+
+    from compare_regions_jp.data.railway import RailwayDataLoader
+
     loader = RailwayDataLoader()
     result = loader.load_railway_data()
 
@@ -24,56 +32,134 @@ def load_railway_data() -> gpd.GeoDataFrame:
     else:
         console.print(f"[dim]データダウンロード完了 ({result.load_time_seconds:.2f}秒)[/dim]")
 
-    return result.data
+    gdf = result.data
+    # 運行本数列をロード時に一度だけ数値化（数値型でない値は0として扱う）
+    # 1日あたりの本数はint32に余裕で収まるため、半分の幅で保持する
+    for column in ("着数1", "発数1", "着数2", "発数2"):
+        if column in gdf.columns:
+            gdf[column] = (
+                pd.to_numeric(gdf[column], errors="coerce").fillna(0).astype("int32")
+            )
+
+    # sindexは遅延構築のため、最初のエリア検索前にここでR-treeを構築しておく
+    _ = gdf.sindex
+
+    return gdf
 
 
 def find_station(gdf: gpd.GeoDataFrame, station_name: str) -> gpd.GeoDataFrame:
     """指定された駅名の駅を検索する."""
-    matches = gdf[gdf["駅名"] == station_name]
-    if matches.empty:
+    # 駅名→行位置の辞書を一度だけ構築し、同じフレームへの検索ではO(1)で再利用
+    # attrsは派生フレームにも伝播するため、構築時の行数を添えて保存し、
+    # 行数が一致しない場合（スライス等）は作り直す
+    cached = gdf.attrs.get("station_name_index")
+    if cached is None or cached[0] != len(gdf):
+        cached = (len(gdf), gdf.groupby("駅名").indices)
+        gdf.attrs["station_name_index"] = cached
+
+    positions = cached[1].get(station_name)
+    if positions is None:
         console.print(f"[bold red]エラー: 駅 '{station_name}' が見つかりません[/bold red]")
         exit(1)
-    return matches
+    return gdf.iloc[positions]
 
 
+@overload
 def calculate_bounding_box(
     lat: float, lon: float, width: float, height: float
 ) -> tuple[float, float, float, float]:
-    """中心座標から境界ボックスを計算する."""
-    minx = lon - width / 2
-    maxx = lon + width / 2
-    miny = lat - height / 2
-    maxy = lat + height / 2
+    ...
+
+
+@overload
+def calculate_bounding_box(
+    lat: np.ndarray, lon: np.ndarray, width: float, height: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    ...
+
+
+def calculate_bounding_box(
+    lat: float | np.ndarray,
+    lon: float | np.ndarray,
+    width: float,
+    height: float,
+) -> tuple[Any, Any, Any, Any]:
+    """中心座標から境界ボックスを計算する.
+
+    lat/lonにはスカラーのほかndarrayも渡せる。その場合は各要素に
+    ブロードキャストされ、N個の境界ボックスを1回の演算で返す。
+    """
+    half_width = width / 2
+    half_height = height / 2
+    minx = lon - half_width
+    maxx = lon + half_width
+    miny = lat - half_height
+    maxy = lat + half_height
     return minx, miny, maxx, maxy
 
 
+def _train_count_block(gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """運行本数4列を(N, 4)のint32行列として取得する（フレーム上にキャッシュ）.
+
+    列の並びは (着数1, 着数2, 発数1, 発数2)。存在しない列は0で埋める。
+    1日あたりの本数はint32に収まり、sum時の累積はint64で行われる。
+    """
+    # attrsは派生フレーム（スライス等）にもコピーされて伝播するため、
+    # 行数が一致しないキャッシュは親フレームのものとみなして作り直す
+    block: np.ndarray | None = gdf.attrs.get("train_count_block")
+    if block is None or len(block) != len(gdf):
+        import numpy as np
+
+        block = np.zeros((len(gdf), 4), dtype=np.int32)
+        for j, column in enumerate(("着数1", "着数2", "発数1", "発数2")):
+            if column in gdf.columns:
+                block[:, j] = gdf[column].to_numpy()
+        gdf.attrs["train_count_block"] = block
+    return block
+
+
+def _station_xy(gdf: gpd.GeoDataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """全駅のx/y座標をfloat64配列として取得する（フレーム上にキャッシュ）."""
+    # attrs伝播で親フレームの配列を引き継いだ場合に備え、行数で有効性を確認する
+    xy: tuple[np.ndarray, np.ndarray] | None = gdf.attrs.get("station_xy")
+    if xy is None or len(xy[0]) != len(gdf):
+        xy = (gdf.geometry.x.to_numpy(), gdf.geometry.y.to_numpy())
+        gdf.attrs["station_xy"] = xy
+    return xy
+
+
+def count_stations_in_areas(
+    gdf: gpd.GeoDataFrame, bboxes: list[tuple[float, float, float, float]]
+) -> list[tuple[int, int, int]]:
+    """複数エリア内の駅の運行本数をまとめて集計する."""
+    import shapely
+    from shapely.geometry import box
+
+    area_boxes = [box(*bbox) for bbox in bboxes]
+    # STRtreeへの一括問い合わせで全エリアの候補を1回で取得し、
+    # contains_xyでエリアごとに一括判定する
+    query_indices, tree_indices = gdf.sindex.query(area_boxes)
+    count_block = _train_count_block(gdf)
+    xs, ys = _station_xy(gdf)
+
+    results: list[tuple[int, int, int]] = []
+    for i, area_box in enumerate(area_boxes):
+        # 候補はフレームを切り出さず、座標・本数の配列を直接インデックスする
+        positions = tree_indices[query_indices == i]
+        mask = shapely.contains_xy(area_box, xs[positions], ys[positions])
+        # 4列を個別に合計せず、(k, 4)行列の1パスで集計する
+        sums = count_block[positions[mask]].sum(axis=0)
+        arrivals = int(sums[0] + sums[1])
+        departures = int(sums[2] + sums[3])
+        results.append((arrivals, departures, arrivals + departures))
+    return results
+
+
 def count_stations_in_area(
     gdf: gpd.GeoDataFrame, bbox: tuple[float, float, float, float]
 ) -> tuple[int, int, int]:
     """指定されたエリア内の駅の運行本数を集計する."""
-    minx, miny, maxx, maxy = bbox
-    area_box = box(minx, miny, maxx, maxy)
-    stations_in_area = gdf[gdf.geometry.within(area_box)]
-
-    total_arrivals = 0
-    total_departures = 0
-    for _, station in stations_in_area.iterrows():
-        arrivals1 = station.get("着数1", 0)
-        departures1 = station.get("発数1", 0)
-        arrivals2 = station.get("着数2", 0)
-        departures2 = station.get("発数2", 0)
-
-        # 数値型でない場合は0として扱う
-        arrivals1 = int(arrivals1) if isinstance(arrivals1, int | float) else 0
-        departures1 = int(departures1) if isinstance(departures1, int | float) else 0
-        arrivals2 = int(arrivals2) if isinstance(arrivals2, int | float) else 0
-        departures2 = int(departures2) if isinstance(departures2, int | float) else 0
-
-        total_arrivals += arrivals1 + arrivals2
-        total_departures += departures1 + departures2
-
-    total_trains = total_arrivals + total_departures
-    return total_arrivals, total_departures, total_trains
+    return count_stations_in_areas(gdf, [bbox])[0]
 
 
 def show_about_info() -> None:
@@ -113,26 +199,32 @@ def display_comparison(
     height: float,
 ) -> None:
     """駅周辺エリアの比較結果を表示する."""
-    table = Table(title="駅周辺エリア比較")
-    table.add_column("項目", style="cyan")
-    table.add_column(station1_name, style="green")
-    table.add_column(station2_name, style="blue")
-
-    table.add_row("緯度", f"{station1_coords[0]:.6f}", f"{station2_coords[0]:.6f}")
-    table.add_row("経度", f"{station1_coords[1]:.6f}", f"{station2_coords[1]:.6f}")
-    table.add_row("エリア幅(度)", f"{width}", f"{width}")
-    table.add_row("エリア高さ(度)", f"{height}", f"{height}")
+    from rich.table import Table
 
     station1_arrivals, station1_departures, station1_total = station1_trains
     station2_arrivals, station2_departures, station2_total = station2_trains
 
-    table.add_row("到着本数", f"{station1_arrivals}", f"{station2_arrivals}")
-    table.add_row("出発本数", f"{station1_departures}", f"{station2_departures}")
-    table.add_row("総運行本数", f"{station1_total}", f"{station2_total}")
-
     diff = station1_total - station2_total
     diff_color = "green" if diff > 0 else "red" if diff < 0 else "white"
-    table.add_row("差分", f"[{diff_color}]{diff:+d}[/{diff_color}]", "")
+
+    # 全行を先に組み立ててから一括でテーブルに流し込み、描画は1回だけ行う
+    rows = [
+        ("緯度", f"{station1_coords[0]:.6f}", f"{station2_coords[0]:.6f}"),
+        ("経度", f"{station1_coords[1]:.6f}", f"{station2_coords[1]:.6f}"),
+        ("エリア幅(度)", f"{width}", f"{width}"),
+        ("エリア高さ(度)", f"{height}", f"{height}"),
+        ("到着本数", f"{station1_arrivals}", f"{station2_arrivals}"),
+        ("出発本数", f"{station1_departures}", f"{station2_departures}"),
+        ("総運行本数", f"{station1_total}", f"{station2_total}"),
+        ("差分", f"[{diff_color}]{diff:+d}[/{diff_color}]", ""),
+    ]
+
+    table = Table(title="駅周辺エリア比較")
+    table.add_column("項目", style="cyan")
+    table.add_column(station1_name, style="green")
+    table.add_column(station2_name, style="blue")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -183,8 +275,7 @@ def main(
         station2_coords[0], station2_coords[1], width, height
     )
 
-    station1_trains = count_stations_in_area(gdf, bbox1)
-    station2_trains = count_stations_in_area(gdf, bbox2)
+    station1_trains, station2_trains = count_stations_in_areas(gdf, [bbox1, bbox2])
 
     display_comparison(
         station1,
@@ -3,6 +3,7 @@
 Pydantic Settingsを使用して環境変数とデフォルト設定を管理する。
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -173,14 +174,11 @@ class AppSettings(BaseSettings):
             環境変数名と値の辞書
 
         """
-        env_vars: dict[str, str] = {}
-        env_prefix = "COMPARE_REGIONS_"
-        for field_name in self.model_fields.keys():
-            env_var_name = f"{env_prefix}{field_name.upper()}"
-            env_value = os.getenv(env_var_name)
-            if env_value is not None:
-                env_vars[env_var_name] = env_value
-        return env_vars
+        return {
+            name: value
+            for name in _ENV_VAR_NAMES
+            if (value := os.getenv(name)) is not None
+        }
 
     def validate_configuration(self) -> dict[str, str]:
         """設定の妥当性をチェック。
@@ -218,19 +216,25 @@ class AppSettings(BaseSettings):
         return errors
 
 
-# グローバル設定インスタンス
-settings = AppSettings()
+# 環境変数名はフィールド定義から変わらないため、クラス定義時に一度だけ組み立てる
+_ENV_VAR_NAMES: tuple[str, ...] = tuple(
+    f"COMPARE_REGIONS_{field_name.upper()}" for field_name in AppSettings.model_fields
+)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """設定インスタンスを取得。
 
+    初回呼び出し時に構築し、以降は同じインスタンスを返す
+    （インポート時の.env読み込み・検証コストを回避）。
+
     Returns
     -------
         アプリケーション設定インスタンス
 
     """
-    return settings
+    return AppSettings()
 
 
 def reload_settings() -> AppSettings:
@@ -241,6 +245,5 @@ def reload_settings() -> AppSettings:
         新しい設定インスタンス
 
     """
-    global settings
-    settings = AppSettings()
-    return settings
+    get_settings.cache_clear()
+    return get_settings()
@@ -0,0 +1 @@
+"""コアドメインパッケージ。"""
@@ -1,12 +1,17 @@
 """地域定義と境界取得"""
 
+import hashlib
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from pathlib import Path
 
 import geopandas as gpd
 
+from compare_regions_jp.config.settings import get_settings
 
-@dataclass
+
+@dataclass(slots=True)
 class RegionSpec:
     """地域指定仕様"""
 
@@ -18,7 +23,7 @@ class RegionSpec:
 class Region(ABC):
     """地域抽象基底クラス"""
 
-    def __init__(self, spec: RegionSpec):
+    def __init__(self, spec: RegionSpec, **kwargs: int):
         """初期化"""
         self.spec = spec
         self._geometry: gpd.GeoDataFrame | None = None
@@ -28,11 +33,44 @@ class Region(ABC):
         """地域の境界形状を取得"""
         pass
 
+    def _cache_key(self) -> str:
+        """地域指定仕様から一意に決まるキャッシュキー"""
+        return f"{self.spec.region_type}_{self.spec.primary}_{self.spec.secondary}"
+
+    def _cache_path(self) -> Path:
+        """境界形状のディスクキャッシュファイルパス"""
+        hash_value = hashlib.sha256(self._cache_key().encode()).hexdigest()[:16]
+        return get_settings().cache_dir / "regions" / f"region_{hash_value}.parquet"
+
+    def _load_geometry(self) -> gpd.GeoDataFrame:
+        """ディスクキャッシュを確認してから境界形状を取得"""
+        settings = get_settings()
+        cache_path = self._cache_path()
+
+        if settings.cache_enabled and cache_path.exists():
+            age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
+            if age_hours <= settings.cache_ttl_hours:
+                try:
+                    return gpd.read_parquet(cache_path)
+                except Exception:
+                    pass  # 読み込めない場合は再計算
+
+        geometry = self.get_geometry()
+
+        if settings.cache_enabled:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                geometry.to_parquet(cache_path)
+            except Exception:
+                pass  # キャッシュ保存に失敗しても継続
+
+        return geometry
+
     @property
     def geometry(self) -> gpd.GeoDataFrame:
-        """キャッシュされた境界形状"""
+        """キャッシュされた境界形状（プロセス内＋ディスク）"""
         if self._geometry is None:
-            self._geometry = self.get_geometry()
+            self._geometry = self._load_geometry()
         return self._geometry
 
 
@@ -53,18 +91,26 @@ class StationWalkRegion(Region):
         super().__init__(spec)
         self.walk_minutes = walk_minutes
 
+    def _cache_key(self) -> str:
+        """徒歩時間も含めたキャッシュキー"""
+        return f"{super()._cache_key()}_{self.walk_minutes}"
+
     def get_geometry(self) -> gpd.GeoDataFrame:
         """駅徒歩圏の境界形状を取得"""
         # TODO: OSMnxで等時圏生成
         raise NotImplementedError("駅徒歩圏計算は未実装")
 
 
+# 地域タイプ→実装クラスのレジストリ（新タイプはここに登録するだけでよい）
+_REGION_REGISTRY: dict[str, type[Region]] = {
+    "address": AddressRegion,
+    "station": StationWalkRegion,
+}
+
+
 def create_region(spec: RegionSpec, **kwargs: int) -> Region:
     """地域仕様からRegionインスタンスを生成"""
-    if spec.region_type == "address":
-        return AddressRegion(spec)
-    elif spec.region_type == "station":
-        walk_minutes = kwargs.get("walk_minutes", 10)
-        return StationWalkRegion(spec, walk_minutes)
-    else:
+    region_class = _REGION_REGISTRY.get(spec.region_type)
+    if region_class is None:
         raise ValueError(f"未対応の地域タイプ: {spec.region_type}")
+    return region_class(spec, **kwargs)
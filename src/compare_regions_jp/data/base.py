@@ -1,17 +1,41 @@
-"""データローダー抽象基底クラス。
+"""データローダー基底クラス。
 
 統一されたキャッシュ機能、エラーハンドリング、実行時間計測を提供する。
 """
 
+import functools
 import hashlib
+import os
 import time
-from abc import ABC, abstractmethod
+import types
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from compare_regions_jp.config.settings import get_settings
 
+# デバッグ出力用Console（構築コストがあるため初回必要時のみ作成して共有）
+_debug_console: Any = None
+
+
+def _get_debug_console() -> Any:
+    """デバッグ出力用のConsoleを遅延構築して返す。
+
+    Returns
+    -------
+        共有のrich Consoleインスタンス
+
+    """
+    global _debug_console
+    if _debug_console is None:
+        from rich.console import Console
+
+        _debug_console = Console()
+    return _debug_console
+
 
 @dataclass
 class DataLoadResult:
@@ -33,7 +57,7 @@ class DataLoadResult:
     cached: bool
     load_time_seconds: float
     cache_path: Path | None = None
-    metadata: dict[str, Any] | None = None
+    metadata: Mapping[str, Any] | None = None
 
 
 class DataLoadError(Exception):
@@ -62,11 +86,23 @@ class CacheError(Exception):
     pass
 
 
-class BaseDataLoader(ABC):
-    """データローダー抽象基底クラス。
+class CacheNotModifiedError(Exception):
+    """ソース側が未更新で、既存キャッシュを継続利用できることを示すシグナル。
+
+    具象ローダーが_load_data_from_source内の再検証（条件付きGET等）で
+    ソースの未更新を確認した場合に送出し、基底クラスが期限切れキャッシュを
+    延命して再利用する。
+    """
+
+    pass
+
+
+class BaseDataLoader:
+    """データローダー基底クラス。
 
     キャッシュ機能、エラーハンドリング、実行時間計測機能を提供する。
     具象クラスは_load_data_from_sourceメソッドを実装する必要がある。
+    ABCのメタクラス処理を避けるため、未実装メソッドはNotImplementedErrorを送出する。
     """
 
     def __init__(
@@ -84,10 +120,21 @@ class BaseDataLoader(ABC):
             cache_dir: キャッシュディレクトリ。Noneの場合は設定値を使用
 
         """
-        settings = get_settings()
-        self.cache_enabled = cache_enabled and settings.cache_enabled
-        self.cache_ttl_hours = cache_ttl_hours or settings.cache_ttl_hours
-        self.cache_dir = cache_dir or settings.cache_dir
+        # 設定はインスタンスに保持し、ホットパスから毎回解決し直さない
+        self._settings = get_settings()
+        self.cache_enabled = cache_enabled and self._settings.cache_enabled
+        self.cache_ttl_hours = cache_ttl_hours or self._settings.cache_ttl_hours
+        self.cache_dir = cache_dir or self._settings.cache_dir
+        # (source, kwargs) → キャッシュパスのメモ（同一ソースの再ハッシュを回避）
+        self._path_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], Path] = {}
+        # キャッシュファイル→パース済みデータのプロセス内LRU
+        # （同一プロセス内の再ロードでファイルIO・パースを省略）
+        self._mem_cache: OrderedDict[Path, Any] = OrderedDict()
+        self._mem_cache_max = 4
+        # cache_ttl_hoursは初期化後不変のため、メタデータは共有の不変マッピングで使い回す
+        self._metadata = types.MappingProxyType(
+            {"cache_ttl_hours": self.cache_ttl_hours}
+        )
 
         if self.cache_enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -113,49 +160,80 @@ class BaseDataLoader(ABC):
             CacheError: キャッシュ操作に失敗した場合
 
         """
-        start_time = time.time()
+        # 経過時間計測には単調増加のperf_counterを使用（壁時計のジャンプの影響を受けない）
+        start_time = time.perf_counter()
+
+        # キャッシュパスと有効性は入口で1回だけ解決し、読み込み・保存の両分岐で再利用する
+        cache_path: Path | None = None
+        cache_valid = False
+        if self.cache_enabled:
+            cache_path, cache_valid = self._resolve_cache(source, **kwargs)
 
         try:
             # キャッシュから取得を試行
-            if self.cache_enabled:
-                cache_path = self._get_cache_path(source, **kwargs)
-                if self._is_cache_valid(cache_path):
-                    try:
+            if cache_path is not None and cache_valid:
+                try:
+                    if cache_path in self._mem_cache:
+                        self._mem_cache.move_to_end(cache_path)
+                        data = self._mem_cache[cache_path]
+                    else:
                         data = self._load_from_cache(cache_path)
-                        load_time = time.time() - start_time
-                        return DataLoadResult(
-                            data=data,
-                            source=source,
-                            cached=True,
-                            load_time_seconds=load_time,
-                            cache_path=cache_path,
-                            metadata={"cache_ttl_hours": self.cache_ttl_hours},
-                        )
-                    except Exception as e:
-                        # キャッシュ読み込みに失敗した場合は警告してソースから取得
-                        self._handle_cache_error(f"キャッシュ読み込み失敗: {e}", cache_path)
+                        self._store_in_mem_cache(cache_path, data)
+                    load_time = time.perf_counter() - start_time
+                    return DataLoadResult(
+                        data=data,
+                        source=source,
+                        cached=True,
+                        load_time_seconds=load_time,
+                        cache_path=cache_path,
+                        metadata=self._metadata,
+                    )
+                except Exception as e:
+                    # キャッシュ読み込みに失敗した場合は警告してソースから取得
+                    self._handle_cache_error(f"キャッシュ読み込み失敗: {e}", cache_path)
 
             # ソースから直接ロード
-            data = self._load_data_from_source(source, **kwargs)
-            load_time = time.time() - start_time
-
-            # キャッシュに保存
-            cache_path_save: Path | None = None
-            if self.cache_enabled:
+            try:
+                data = self._load_data_from_source(source, **kwargs)
+            except CacheNotModifiedError:
+                if cache_path is None:
+                    raise
+                # ソース未更新が確認できたため、期限切れキャッシュの
+                # mtimeを更新してTTLを延長し、そのまま再利用する
+                os.utime(cache_path)
+                if cache_path in self._mem_cache:
+                    self._mem_cache.move_to_end(cache_path)
+                    data = self._mem_cache[cache_path]
+                else:
+                    data = self._load_from_cache(cache_path)
+                    self._store_in_mem_cache(cache_path, data)
+                load_time = time.perf_counter() - start_time
+                return DataLoadResult(
+                    data=data,
+                    source=source,
+                    cached=True,
+                    load_time_seconds=load_time,
+                    cache_path=cache_path,
+                    metadata=self._metadata,
+                )
+            load_time = time.perf_counter() - start_time
+
+            # キャッシュに保存（パスは入口で解決済みのものを再利用）
+            if cache_path is not None:
                 try:
-                    cache_path_save = self._get_cache_path(source, **kwargs)
-                    self._save_to_cache(data, cache_path_save)
+                    self._save_to_cache(data, cache_path)
+                    self._store_in_mem_cache(cache_path, data)
                 except Exception as e:
                     # キャッシュ保存に失敗しても継続
-                    self._handle_cache_error(f"キャッシュ保存失敗: {e}", cache_path_save)
+                    self._handle_cache_error(f"キャッシュ保存失敗: {e}", cache_path)
 
             return DataLoadResult(
                 data=data,
                 source=source,
                 cached=False,
                 load_time_seconds=load_time,
-                cache_path=cache_path_save,
-                metadata={"cache_ttl_hours": self.cache_ttl_hours},
+                cache_path=cache_path,
+                metadata=self._metadata,
             )
 
         except DataLoadError:
@@ -163,9 +241,8 @@ class BaseDataLoader(ABC):
         except Exception as e:
             raise DataLoadError(f"データロードに失敗しました: {e}", source, original_error=e) from e
 
-    @abstractmethod
     def _load_data_from_source(self, source: str, **kwargs: Any) -> Any:
-        """ソースからデータを直接ロードする（抽象メソッド）。
+        """ソースからデータを直接ロードする（具象クラスで実装）。
 
         Args:
         ----
@@ -181,11 +258,10 @@ class BaseDataLoader(ABC):
             DataLoadError: ロードに失敗した場合
 
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def _save_to_cache(self, data: Any, cache_path: Path) -> None:
-        """データをキャッシュに保存する（抽象メソッド）。
+        """データをキャッシュに保存する（具象クラスで実装）。
 
         Args:
         ----
@@ -197,11 +273,10 @@ class BaseDataLoader(ABC):
             CacheError: 保存に失敗した場合
 
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def _load_from_cache(self, cache_path: Path) -> Any:
-        """キャッシュからデータを読み込む（抽象メソッド）。
+        """キャッシュからデータを読み込む（具象クラスで実装）。
 
         Args:
         ----
@@ -216,7 +291,18 @@ class BaseDataLoader(ABC):
             CacheError: 読み込みに失敗した場合
 
         """
-        pass
+        raise NotImplementedError
+
+    @functools.cached_property
+    def _loader_prefix(self) -> str:
+        """キャッシュファイル名に使うローダー接頭辞（クラスごとに不変）。
+
+        Returns
+        -------
+            クラス名から導出した接頭辞（例: RailwayDataLoader → "railway"）
+
+        """
+        return type(self).__name__.lower().removesuffix("loader")
 
     def _get_cache_path(self, source: str, **kwargs: Any) -> Path:
         """キャッシュファイルパスを生成する。
@@ -233,15 +319,59 @@ class BaseDataLoader(ABC):
             キャッシュファイルパス
 
         """
-        # ソースとパラメータからハッシュ値を生成
-        cache_key = f"{source}_{sorted(kwargs.items())}"
-        hash_value = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
+        memo_key = (source, tuple(sorted(kwargs.items())))
+        cached_path = self._path_cache.get(memo_key)
+        if cached_path is not None:
+            return cached_path
+
+        # ソースとパラメータから正規化したバイト列を逐次ハッシュ化
+        # （sorted結果をreprした巨大な一時文字列を経由しない。
+        # 暗号学的強度は不要なため高速なBLAKE2bを8バイトダイジェストで使用）
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(source.encode())
+        for key, value in sorted(kwargs.items()):
+            hasher.update(b"\x1f")
+            hasher.update(key.encode())
+            hasher.update(b"=")
+            hasher.update(repr(value).encode())
+        hash_value = hasher.hexdigest()
 
         # ローダー名を含むファイル名を生成
-        loader_name = self.__class__.__name__.lower().replace("loader", "")
-        filename = f"{loader_name}_{hash_value}.cache"
+        filename = f"{self._loader_prefix}_{hash_value}.cache"
+
+        cache_path = self.cache_dir / filename
+        self._path_cache[memo_key] = cache_path
+        return cache_path
+
+    def _store_in_mem_cache(self, cache_path: Path, data: Any) -> None:
+        """パース済みデータをプロセス内LRUキャッシュに保存する。
+
+        Args:
+        ----
+            cache_path: キャッシュファイルパス
+            data: パース済みデータ
+
+        """
+        self._mem_cache[cache_path] = data
+        self._mem_cache.move_to_end(cache_path)
+        while len(self._mem_cache) > self._mem_cache_max:
+            self._mem_cache.popitem(last=False)
 
-        return self.cache_dir / filename
+    def _resolve_cache(self, source: str, **kwargs: Any) -> tuple[Path, bool]:
+        """キャッシュパスとその有効性をまとめて解決する。
+
+        Args:
+        ----
+            source: データソース
+            **kwargs: 追加パラメータ
+
+        Returns:
+        -------
+            (キャッシュファイルパス, キャッシュが有効かどうか) のタプル
+
+        """
+        cache_path = self._get_cache_path(source, **kwargs)
+        return cache_path, self._is_cache_valid(cache_path)
 
     def _is_cache_valid(self, cache_path: Path) -> bool:
         """キャッシュが有効かどうかを判定する。
@@ -255,11 +385,14 @@ class BaseDataLoader(ABC):
             キャッシュが有効な場合True
 
         """
-        if not cache_path.exists():
+        # exists()とstat()で2回statを発行しないよう、1回のstatで判定する
+        try:
+            st_mtime = cache_path.stat().st_mtime
+        except OSError:
             return False
 
         # TTLチェック
-        cache_age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
+        cache_age_hours = (time.time() - st_mtime) / 3600
         return cache_age_hours <= self.cache_ttl_hours
 
     def _handle_cache_error(self, message: str, cache_path: Path | None = None) -> None:
@@ -272,18 +405,19 @@ class BaseDataLoader(ABC):
 
         """
         # デバッグ設定の場合はエラーを出力
-        settings = get_settings()
-        if settings.debug:
-            from rich.console import Console
+        if self._settings.debug:
+            _get_debug_console().print(f"[yellow]警告: {message}[/yellow]")
 
-            console = Console()
-            console.print(f"[yellow]警告: {message}[/yellow]")
-
-        # 破損したキャッシュファイルを削除
-        if cache_path and cache_path.exists():
+        # 破損したキャッシュファイルを削除（存在確認のstatは省略）
+        # ETag等のサイドカーも一緒に削除して孤児ファイルを残さない
+        if cache_path:
             try:
-                cache_path.unlink()
-            except Exception:
+                cache_path.with_suffix(".etag").unlink(missing_ok=True)
+            except OSError:
+                pass
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
                 pass  # 削除に失敗しても継続
 
     def clear_cache(self, source: str | None = None, **kwargs: Any) -> int:
@@ -305,23 +439,47 @@ class BaseDataLoader(ABC):
         deleted_count = 0
 
         if source is None:
-            # 全体をクリア
-            loader_prefix = self.__class__.__name__.lower().replace("loader", "")
-            for cache_file in self.cache_dir.glob(f"{loader_prefix}_*.cache"):
+            # 全体をクリア（unlinkのレイテンシをスレッドで重ねて並列削除）
+            # 列挙はglobの正規表現コンパイルを避けてscandir＋接頭辞判定で行う
+            prefix = f"{self._loader_prefix}_"
+            with os.scandir(self.cache_dir) as entries:
+                cache_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(".cache")
+                ]
+            if not cache_files:
+                return 0
+
+            def safe_unlink(cache_file: Path) -> int:
+                """ファイルを削除し、成功なら1・失敗なら0を返す。"""
+                # ETag等のサイドカーも一緒に削除して孤児ファイルを残さない
+                try:
+                    cache_file.with_suffix(".etag").unlink(missing_ok=True)
+                except OSError:
+                    pass
                 try:
                     cache_file.unlink()
-                    deleted_count += 1
+                    return 1
                 except Exception:
-                    pass
+                    return 0
+
+            max_workers = min(32, len(cache_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                deleted_count = sum(executor.map(safe_unlink, cache_files))
         else:
             # 特定のソースのキャッシュをクリア
+            # （事前のexists()によるstatは発行せず、unlinkの結果で判定する）
             cache_path = self._get_cache_path(source, **kwargs)
-            if cache_path.exists():
-                try:
-                    cache_path.unlink()
-                    deleted_count = 1
-                except Exception:
-                    pass
+            try:
+                cache_path.with_suffix(".etag").unlink(missing_ok=True)
+            except OSError:
+                pass
+            try:
+                cache_path.unlink()
+                deleted_count = 1
+            except OSError:
+                pass
 
         return deleted_count
 
@@ -342,27 +500,37 @@ class BaseDataLoader(ABC):
                 "total_size_bytes": 0,
             }
 
-        # ローダー固有のキャッシュファイルを検索
-        loader_prefix = self.__class__.__name__.lower().replace("loader", "")
-        cache_files = list(self.cache_dir.glob(f"{loader_prefix}_*.cache"))
-
-        total_size = sum(f.stat().st_size for f in cache_files if f.exists())
+        # ローダー固有のキャッシュファイルをscandirで1パス走査
+        # （DirEntryのstat結果は再利用されるため、ファイルあたりstatは1回）
+        prefix = f"{self._loader_prefix}_"
+        now = time.time()
+
+        files: list[dict[str, Any]] = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not (
+                    entry.name.startswith(prefix) and entry.name.endswith(".cache")
+                ):
+                    continue
+                stat_result = entry.stat()
+                age_hours = (now - stat_result.st_mtime) / 3600
+                total_size += stat_result.st_size
+                files.append(
+                    {
+                        "path": entry.path,
+                        "size_bytes": stat_result.st_size,
+                        "modified_time": stat_result.st_mtime,
+                        "age_hours": age_hours,
+                        "valid": age_hours <= self.cache_ttl_hours,
+                    }
+                )
 
         return {
             "enabled": True,
             "cache_dir": str(self.cache_dir),
             "ttl_hours": self.cache_ttl_hours,
-            "file_count": len(cache_files),
+            "file_count": len(files),
             "total_size_bytes": total_size,
-            "files": [
-                {
-                    "path": str(f),
-                    "size_bytes": f.stat().st_size,
-                    "modified_time": f.stat().st_mtime,
-                    "age_hours": (time.time() - f.stat().st_mtime) / 3600,
-                    "valid": self._is_cache_valid(f),
-                }
-                for f in cache_files
-                if f.exists()
-            ],
+            "files": files,
         }
@@ -3,15 +3,28 @@
 GTFS-GIS.jpから鉄道運行本数データを取得し、統一されたキャッシュ機能を提供する。
 """
 
-import tempfile
+import io
 from pathlib import Path
 from typing import Any
-from urllib.request import urlretrieve
 
 import geopandas as gpd
+import requests
 from rich.console import Console
 
-from compare_regions_jp.data.base import BaseDataLoader, CacheError, DataLoadError
+from compare_regions_jp.config.settings import get_settings
+from compare_regions_jp.data.base import (
+    BaseDataLoader,
+    CacheError,
+    CacheNotModifiedError,
+    DataLoadError,
+    DataLoadResult,
+)
+
+# GeoJSONの読み書きはfionaではなくpyogrio（C/C++実装、Arrow対応）で行う
+gpd.options.io_engine = "pyogrio"
+
+# Consoleの構築は軽くないため、インスタンスごとではなくモジュールで1つ共有する
+_console = Console()
 
 
 class RailwayDataLoader(BaseDataLoader):
@@ -21,19 +34,11 @@ class RailwayDataLoader(BaseDataLoader):
     指定されたbounding boxでフィルタリングする。
     """
 
-    def __init__(self, cache_enabled: bool = True):
-        """鉄道データローダーを初期化。
-
-        Args:
-        ----
-            cache_enabled: キャッシュ機能の有効/無効
+    # 全インスタンスで同一のため、クラス属性として1回だけ束縛する
+    data_url = "https://gtfs-gis.jp/railway_honsu/data/unkohonsu2024_rosen_eki.geojson"
 
-        """
-        super().__init__(cache_enabled=cache_enabled)
-        self.data_url = (
-            "https://gtfs-gis.jp/railway_honsu/data/unkohonsu2024_rosen_eki.geojson"
-        )
-        self.console = Console()
+    # 直近のダウンロードで受け取ったETag（_save_to_cacheでサイドカーに書き出す）
+    _pending_etag: str | None = None
 
     def load_railway_data(
         self, bbox: tuple[float, float, float, float] | None = None
@@ -50,8 +55,23 @@ class RailwayDataLoader(BaseDataLoader):
             鉄道データのロード結果（DataLoadResult）
 
         """
-        source = f"{self.data_url}?bbox={bbox}" if bbox else self.data_url
-        return self.load_data(source, bbox=bbox)
+        # 全データを安定したキーで1回だけダウンロード・キャッシュし、
+        # bboxごとの再取得を避けてメモリ上でフィルタリングする
+        result = self.load_data(self.data_url)
+        if bbox is None or result.data is None:
+            return result
+
+        minx, miny, maxx, maxy = bbox
+        return DataLoadResult(
+            # .cxは座標スライスのためfloatの添字を受け付ける（mypyの整数スライス
+            # 前提の検査には引っかかるが正しい使い方）
+            data=result.data.cx[minx:maxx, miny:maxy],  # type: ignore[misc]
+            source=f"{self.data_url}?bbox={bbox}",
+            cached=result.cached,
+            load_time_seconds=result.load_time_seconds,
+            cache_path=result.cache_path,
+            metadata=result.metadata,
+        )
 
     def _load_data_from_source(self, source: str, **kwargs: Any) -> gpd.GeoDataFrame:
         """ソースから鉄道データを直接ロード。
@@ -68,40 +88,56 @@ class RailwayDataLoader(BaseDataLoader):
         Raises:
         ------
             DataLoadError: データロードに失敗した場合
+            CacheNotModifiedError: ソース未更新で既存キャッシュを再利用できる場合
 
         """
+        # 期限切れキャッシュとETagサイドカーが残っていれば条件付きGETで再検証し、
+        # 未更新（304）ならダウンロードとパースを丸ごと省略する
+        headers: dict[str, str] = {}
+        if self.cache_enabled:
+            cache_path = self._get_cache_path(source, **kwargs)
+            if cache_path.exists():
+                try:
+                    etag = cache_path.with_suffix(".etag").read_text()
+                except OSError:
+                    etag = ""
+                if etag:
+                    headers["If-None-Match"] = etag
+
         try:
             # ライセンス情報とダウンロード状況を表示
-            self.console.print("📄 データライセンス: CC BY 4.0, ODbL")
-            self.console.print("📍 データ提供: GTFS-GIS.jp")
-            self.console.print(f"⬇️  鉄道運行本数データをダウンロード中: {self.data_url}")
-
-            # 一時ファイルにダウンロード
-            with tempfile.NamedTemporaryFile(
-                suffix=".geojson", delete=False
-            ) as temp_file:
-                temp_path = Path(temp_file.name)
-
-            try:
-                urlretrieve(self.data_url, temp_path)
-
-                # GeoDataFrameとして読み込み
-                gdf = gpd.read_file(temp_path)
-
-                # bboxフィルタリング
-                bbox = kwargs.get("bbox")
-                if bbox is not None:
-                    minx, miny, maxx, maxy = bbox
-                    # 境界ボックス内のデータのみフィルタリング
-                    gdf = gdf.cx[minx:maxx, miny:maxy]
-
-                return gdf
-
-            finally:
-                # 一時ファイルを削除
-                if temp_path.exists():
-                    temp_path.unlink()
-
+            _console.print("📄 データライセンス: CC BY 4.0, ODbL")
+            _console.print("📍 データ提供: GTFS-GIS.jp")
+            _console.print(f"⬇️  鉄道運行本数データをダウンロード中: {self.data_url}")
+
+            # メモリ上のバッファへストリーミング
+            # （一時ファイルへの書き込み→読み戻しのディスク2往復を省略）
+            with requests.get(
+                self.data_url,
+                stream=True,
+                timeout=get_settings().api_timeout,
+                headers=headers,
+            ) as response:
+                if response.status_code == 304:
+                    _console.print("[dim]ソース未更新のため既存キャッシュを再利用[/dim]")
+                    raise CacheNotModifiedError
+                response.raise_for_status()
+                self._pending_etag = response.headers.get("ETag")
+                buffer = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    buffer.write(chunk)
+            buffer.seek(0)
+
+            # GeoDataFrameとして読み込み（使用する列のみ射影して省メモリ化、
+            # bboxフィルタはGDAL/OGR側にプッシュダウンしてパース時に適用）
+            return gpd.read_file(
+                buffer,
+                columns=["駅名", "着数1", "発数1", "着数2", "発数2"],
+                bbox=kwargs.get("bbox"),
+            )
+
+        except CacheNotModifiedError:
+            raise
         except Exception as e:
             raise DataLoadError(
                 f"鉄道データの取得に失敗しました: {e}", source, original_error=e
@@ -121,9 +157,13 @@ class RailwayDataLoader(BaseDataLoader):
 
         """
         try:
-            # GeoJSONとして保存
-            data.to_file(cache_path, driver="GeoJSON")
-            self.console.print(f"[green]キャッシュに保存: {cache_path}[/green]")
+            # GeoParquet（バイナリ列指向・WKBジオメトリ）として保存
+            # zstd圧縮でファイルサイズを抑えつつ、展開はgzipより高速
+            data.to_parquet(cache_path, compression="zstd")
+            # 次回の条件付きGET用にETagをサイドカーとして保存
+            if isinstance(self._pending_etag, str) and self._pending_etag:
+                cache_path.with_suffix(".etag").write_text(self._pending_etag)
+            _console.print(f"[green]キャッシュに保存: {cache_path}[/green]")
         except Exception as e:
             raise CacheError(f"キャッシュ保存に失敗しました: {e}") from e
 
@@ -144,6 +184,7 @@ class RailwayDataLoader(BaseDataLoader):
 
         """
         try:
-            return gpd.read_file(cache_path)
+            # 旧形式（GeoJSON）のキャッシュはここで失敗し、呼び出し側で破棄される
+            return gpd.read_parquet(cache_path)
         except Exception as e:
             raise CacheError(f"キャッシュ読み込みに失敗しました: {e}") from e
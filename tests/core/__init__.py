@@ -0,0 +1 @@
+"""コアモジュールテストパッケージ。"""
@@ -0,0 +1,105 @@
+"""地域定義と境界形状ディスクキャッシュのテスト。"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import geopandas as gpd
+import pytest
+from compare_regions_jp.core.region import Region, RegionSpec, StationWalkRegion
+from shapely.geometry import Point
+
+
+@dataclass(slots=True)
+class FakeSettings:
+    """テスト用の設定スタブ。"""
+
+    cache_dir: Path
+    cache_enabled: bool = True
+    cache_ttl_hours: float = 24
+
+
+class StubRegion(Region):
+    """get_geometryの呼び出し回数を数えるテスト用Region。"""
+
+    def __init__(self, spec: RegionSpec):
+        super().__init__(spec)
+        self.compute_count = 0
+
+    def get_geometry(self) -> gpd.GeoDataFrame:
+        """固定の境界形状を返し、呼び出し回数を記録する。"""
+        self.compute_count += 1
+        return gpd.GeoDataFrame({"名称": ["テスト"], "geometry": [Point(139.7, 35.7)]})
+
+
+@pytest.fixture(autouse=True)
+def region_env(monkeypatch, tmp_path):
+    """regionモジュールの設定をテスト用スタブに差し替える。"""
+    settings = FakeSettings(cache_dir=tmp_path)
+    monkeypatch.setattr(
+        "compare_regions_jp.core.region.get_settings", lambda: settings
+    )
+    return settings
+
+
+def _make_region() -> StubRegion:
+    return StubRegion(RegionSpec(region_type="station", primary="渋谷"))
+
+
+def test_境界形状がキャッシュへ書き込まれ読み戻される():
+    region = _make_region()
+    first = region._load_geometry()
+
+    assert region.compute_count == 1
+    assert region._cache_path().exists()
+
+    # 別インスタンスはディスクキャッシュから読み、再計算しない
+    other = _make_region()
+    loaded = other._load_geometry()
+    assert other.compute_count == 0
+    assert list(loaded["名称"]) == list(first["名称"])
+
+
+def test_期限切れキャッシュは再計算される(region_env):
+    region_env.cache_ttl_hours = 1
+    region = _make_region()
+    region._load_geometry()
+
+    # キャッシュのmtimeをTTL超過まで巻き戻す
+    cache_path = region._cache_path()
+    expired = time.time() - 7200
+    os.utime(cache_path, (expired, expired))
+
+    other = _make_region()
+    other._load_geometry()
+    assert other.compute_count == 1
+
+
+def test_破損キャッシュは読み飛ばして再計算される():
+    region = _make_region()
+    cache_path = region._cache_path()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(b"corrupted data")
+
+    result = region._load_geometry()
+    assert region.compute_count == 1
+    assert list(result["名称"]) == ["テスト"]
+
+
+def test_キャッシュ無効時はディスクに書き込まない(region_env):
+    region_env.cache_enabled = False
+    region = _make_region()
+    region._load_geometry()
+
+    assert not region._cache_path().exists()
+
+
+def test_徒歩圏キャッシュキーに徒歩時間が含まれる():
+    spec = RegionSpec(region_type="station", primary="渋谷")
+    region10 = StationWalkRegion(spec, walk_minutes=10)
+    region15 = StationWalkRegion(spec, walk_minutes=15)
+
+    assert region10._cache_key().endswith("_10")
+    assert region10._cache_key() != region15._cache_key()
+    assert region10._cache_path() != region15._cache_path()
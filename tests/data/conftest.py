@@ -0,0 +1,31 @@
+"""データローダーテスト共通のフィクスチャ。"""
+
+import geopandas as gpd
+import pytest
+
+# テストデータ
+SAMPLE_RAILWAY_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"駅名": "渋谷", "着数1": 100, "発数1": 102},
+            "geometry": {"type": "Point", "coordinates": [139.7016, 35.6580]},
+        },
+        {
+            "type": "Feature",
+            "properties": {"駅名": "新宿", "着数1": 150, "発数1": 155},
+            "geometry": {"type": "Point", "coordinates": [139.7004, 35.6896]},
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="session")
+def sample_railway_gdf():
+    """サンプル鉄道データのGeoDataFrame。
+
+    構築コスト（Point生成＋DataFrame構築）をセッション全体で1回に抑える。
+    読み取り専用で共有されるため、変更が必要なテストではcopy()すること。
+    """
+    return gpd.GeoDataFrame.from_features(SAMPLE_RAILWAY_DATA["features"])
@@ -1,8 +1,12 @@
-"""データローダー抽象基底クラスのテスト。"""
+"""データローダー抽象基底クラスのテスト。
 
-import json
-import tempfile
+収集コストの高いdescribeネストは使わず、フラットなtest_関数として定義する。
+セクションはコメントで区切る。
+"""
+
+import pickle
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
@@ -35,606 +39,420 @@ class TestDataLoader(BaseDataLoader):
         self.save_call_count += 1
         if cache_path.name.startswith("error_"):
             raise CacheError("キャッシュ保存エラー")
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        # 1回のwriteシステムコールにまとめて書き込む
+        cache_path.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
 
     def _load_from_cache(self, cache_path: Path) -> dict[str, Any]:
         if cache_path.name.startswith("error_"):
             raise CacheError("キャッシュ読み込みエラー")
-        with open(cache_path) as f:
-            return json.load(f)
-
-
-def describe_DataLoadResult():
-    """DataLoadResultの動作テスト。"""
-
-    def データクラスが正しく初期化される():
-        result = DataLoadResult(
-            data={"test": "data"},
-            source="test_source",
-            cached=True,
-            load_time_seconds=1.5,
-            cache_path=Path("/tmp/cache"),
-            metadata={"key": "value"},
-        )
-
-        assert result.data == {"test": "data"}
-        assert result.source == "test_source"
-        assert result.cached is True
-        assert result.load_time_seconds == 1.5
-        assert result.cache_path == Path("/tmp/cache")
-        assert result.metadata == {"key": "value"}
-
-    def オプショナル引数がデフォルト値になる():
-        result = DataLoadResult(
-            data={"test": "data"},
-            source="test_source",
-            cached=False,
-            load_time_seconds=1.0,
-        )
-
-        assert result.cache_path is None
-        assert result.metadata is None
-
-
-def describe_DataLoadError():
-    """DataLoadErrorの動作テスト。"""
-
-    def エラーメッセージとソースが設定される():
-        error = DataLoadError("テストエラー", "test_source")
-
-        assert str(error) == "テストエラー"
-        assert error.source == "test_source"
-        assert error.original_error is None
-
-    def 元の例外が保持される():
-        original = ValueError("元のエラー")
-        error = DataLoadError("ラップされたエラー", "test_source", original)
-
-        assert error.original_error is original
-
-
-def describe_CacheError():
-    """CacheErrorの動作テスト。"""
-
-    def 基本的な例外として動作する():
-        error = CacheError("キャッシュエラー")
-        assert str(error) == "キャッシュエラー"
-
-
-def describe_BaseDataLoader():
-    """BaseDataLoaderの動作テスト。"""
-
-    def describe_初期化():
-        def デフォルト設定で初期化される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    assert loader.cache_enabled is True
-                    assert loader.cache_ttl_hours == 24
-                    assert loader.cache_dir == Path(temp_dir)
-
-        def カスタム設定で初期化される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                custom_cache_dir = Path(temp_dir) / "custom"
-
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=12,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(
-                        cache_enabled=False,
-                        cache_ttl_hours=48,
-                        cache_dir=custom_cache_dir,
-                    )
-
-                    assert loader.cache_enabled is False
-                    assert loader.cache_ttl_hours == 48
-                    assert loader.cache_dir == custom_cache_dir
-
-        def キャッシュディレクトリが自動作成される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                cache_dir = Path(temp_dir) / "new_cache"
-
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=cache_dir,
-                    )
-
-                    TestDataLoader()
-
-                    assert cache_dir.exists()
-
-    def describe_データロード():
-        def ソースから正常にロードされる():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-                    result = loader.load_data("test_source", param="value")
-
-                    assert isinstance(result, DataLoadResult)
-                    assert result.source == "test_source"
-                    assert result.cached is False
-                    assert result.load_time_seconds > 0
-                    assert "test" in result.data
-
-        def 実行時間が正確に計測される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    with patch.object(loader, "_load_data_from_source") as mock_load:
-
-                        def slow_load(*args, **kwargs):
-                            time.sleep(0.1)
-                            return {"test": "data"}
-
-                        mock_load.side_effect = slow_load
-                        result = loader.load_data("test_source")
-
-                        assert result.load_time_seconds >= 0.1
-
-        def データロードエラーが適切に処理される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    with pytest.raises(DataLoadError) as exc_info:
-                        loader.load_data("error_source")
-
-                    assert exc_info.value.source == "error_source"
-
-        def 予期しない例外がDataLoadErrorでラップされる():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    with patch.object(loader, "_load_data_from_source") as mock_load:
-                        mock_load.side_effect = ValueError("予期しないエラー")
-
-                        with pytest.raises(DataLoadError) as exc_info:
-                            loader.load_data("test_source")
-
-                        assert "データロードに失敗しました" in str(exc_info.value)
-                        assert isinstance(exc_info.value.original_error, ValueError)
-
-    def describe_キャッシュ機能():
-        def キャッシュが無効な場合は常にソースからロード():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(cache_enabled=False)
-
-                    # 最初のロード
-                    result1 = loader.load_data("test_source")
-                    assert result1.cached is False
-
-                    # 2回目のロード
-                    result2 = loader.load_data("test_source")
-                    assert result2.cached is False
-
-                    # ソースから2回ロードされている
-                    assert loader.load_call_count == 2
-
-        def キャッシュからデータがロードされる():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    # 最初のロード（キャッシュに保存）
-                    result1 = loader.load_data("test_source")
-                    assert result1.cached is False
-                    assert loader.load_call_count == 1
-
-                    # 2回目のロード（キャッシュから取得）
-                    result2 = loader.load_data("test_source")
-                    assert result2.cached is True
-                    assert loader.load_call_count == 1  # ソースからは1回のみ
-
-        def 期限切れキャッシュは無視される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=0.000001,  # より短時間
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(cache_ttl_hours=0.000001)
-
-                    # 最初のロード
-                    loader.load_data("test_source")
-
-                    # 十分に待つ
-                    time.sleep(0.1)
-
-                    # 2回目のロード（期限切れなのでソースから）
-                    result2 = loader.load_data("test_source")
-                    assert result2.cached is False
-                    assert loader.load_call_count == 2
-
-        def キャッシュ読み込みエラーでソースからロード():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                        debug=False,
-                    )
-
-                    loader = TestDataLoader()
-
-                    # エラーを起こすキャッシュパスを作成
-                    cache_path = loader._get_cache_path("error_cache_source")
-                    cache_path.write_text("invalid json")
-
-                    # ロード（キャッシュエラーでソースから取得）
-                    result = loader.load_data("error_cache_source")
-                    assert result.cached is False
-
-        def キャッシュ保存エラーでも処理が継続される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                        debug=False,
-                    )
-
-                    loader = TestDataLoader()
-
-                    # キャッシュ保存でエラーが発生するソース
-                    result = loader.load_data("error_save_source")
-
-                    # エラーに関わらず結果は返される
-                    assert result.cached is False
-                    assert result.data is not None
-
-    def describe_キャッシュパス生成():
-        def ソースとパラメータからユニークなパスが生成される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    path1 = loader._get_cache_path("source1", param="a")
-                    path2 = loader._get_cache_path("source2", param="a")
-                    path3 = loader._get_cache_path("source1", param="b")
-
-                    # 全て異なるパス
-                    assert path1 != path2
-                    assert path1 != path3
-                    assert path2 != path3
-
-        def 同じソースとパラメータで同じパスが生成される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    path1 = loader._get_cache_path("source", param="value")
-                    path2 = loader._get_cache_path("source", param="value")
-
-                    assert path1 == path2
-
-        def ローダー名がファイル名に含まれる():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-                    path = loader._get_cache_path("source")
-
-                    assert "testdata_" in path.name
-                    assert path.name.endswith(".cache")
-
-    def describe_キャッシュ有効性判定():
-        def 存在しないファイルは無効():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-                    cache_path = Path(temp_dir) / "nonexistent.cache"
-
-                    assert loader._is_cache_valid(cache_path) is False
-
-        def 期限内のファイルは有効():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-                    cache_path = Path(temp_dir) / "valid.cache"
-                    cache_path.write_text("test")
-
-                    assert loader._is_cache_valid(cache_path) is True
-
-        def 期限切れファイルは無効():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=1,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(cache_ttl_hours=0.000001)
-                    cache_path = Path(temp_dir) / "expired.cache"
-                    cache_path.write_text("test")
-
-                    # 十分に待って期限切れにする
-                    time.sleep(0.1)
-
-                    assert loader._is_cache_valid(cache_path) is False
-
-    def describe_キャッシュクリア():
-        def 全体クリアが正常に動作する():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    # 複数のキャッシュを作成
-                    loader.load_data("source1")
-                    loader.load_data("source2")
-
-                    # クリア実行
-                    deleted_count = loader.clear_cache()
-
-                    assert deleted_count == 2
-
-        def 特定ソースのクリアが正常に動作する():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    # 複数のキャッシュを作成
-                    loader.load_data("source1")
-                    loader.load_data("source2")
-
-                    # 特定ソースをクリア
-                    deleted_count = loader.clear_cache("source1")
-
-                    assert deleted_count == 1
-
-                    # source2のキャッシュは残っている
-                    result = loader.load_data("source2")
-                    assert result.cached is True
-
-        def キャッシュ無効時はゼロが返される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(cache_enabled=False)
-                    deleted_count = loader.clear_cache()
-
-                    assert deleted_count == 0
-
-    def describe_キャッシュ情報取得():
-        def キャッシュ無効時の情報が正しく返される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=False,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader(cache_enabled=False)
-                    info = loader.get_cache_info()
-
-                    assert info["enabled"] is False
-                    assert info["file_count"] == 0
-                    assert info["total_size_bytes"] == 0
-
-        def キャッシュ有効時の詳細情報が返される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                    )
-
-                    loader = TestDataLoader()
-
-                    # キャッシュファイルを作成
-                    loader.load_data("source1")
-                    loader.load_data("source2")
-
-                    info = loader.get_cache_info()
-
-                    assert info["enabled"] is True
-                    assert info["file_count"] == 2
-                    assert info["total_size_bytes"] > 0
-                    assert len(info["files"]) == 2
-
-                    # ファイル情報の確認
-                    file_info = info["files"][0]
-                    assert "path" in file_info
-                    assert "size_bytes" in file_info
-                    assert "modified_time" in file_info
-                    assert "age_hours" in file_info
-                    assert "valid" in file_info
-
-    def describe_エラーハンドリング():
-        def デバッグモード時にキャッシュエラーが表示される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                        debug=True,
-                    )
-
-                    loader = TestDataLoader()
-
-                    # rich.console.Consoleクラスをモック
-                    with patch("rich.console.Console") as mock_console_class:
-                        mock_console = Mock()
-                        mock_console_class.return_value = mock_console
-
-                        loader._handle_cache_error("テストエラー")
-
-                        mock_console.print.assert_called_once()
-
-        def 破損キャッシュファイルが削除される():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with patch(
-                    "compare_regions_jp.data.base.get_settings"
-                ) as mock_settings:
-                    mock_settings.return_value = Mock(
-                        cache_enabled=True,
-                        cache_ttl_hours=24,
-                        cache_dir=Path(temp_dir),
-                        debug=False,
-                    )
-
-                    loader = TestDataLoader()
-
-                    # 破損したキャッシュファイルを作成
-                    cache_path = Path(temp_dir) / "corrupted.cache"
-                    cache_path.write_text("corrupted data")
-
-                    assert cache_path.exists()
-
-                    loader._handle_cache_error("エラー", cache_path)
-
-                    assert not cache_path.exists()
+        return pickle.loads(cache_path.read_bytes())
+
+
+@dataclass(slots=True)
+class FakeSettings:
+    """テスト用の設定スタンドイン（Mockの属性合成コストを避ける）。"""
+
+    cache_dir: Path
+    cache_enabled: bool = True
+    cache_ttl_hours: float = 24
+    debug: bool = False
+
+
+# 毎回再構築せず使い回す共有の元例外
+_SHARED_ORIGINAL = ValueError("元のエラー")
+
+
+@pytest.fixture(autouse=True)
+def loader_env(monkeypatch, tmp_path):
+    """get_settingsを差し替え、テスト用キャッシュディレクトリ付き設定を返す。
+
+    autouseのため全テストが実設定に触れない。テスト個別の設定が必要な
+    場合は、ローダー構築前に属性を書き換える。
+    """
+    settings = FakeSettings(cache_dir=tmp_path)
+    monkeypatch.setattr("compare_regions_jp.data.base.get_settings", lambda: settings)
+    return settings
+
+
+@pytest.fixture
+def populated_loader(loader_env):
+    """source1とsource2のキャッシュを投入済みのローダーを返す。"""
+    loader = TestDataLoader()
+    loader.load_data("source1")
+    loader.load_data("source2")
+    return loader
+
+
+# --- DataLoadResult ---
+
+
+def test_データクラスが正しく初期化される():
+    result = DataLoadResult(
+        data={"test": "data"},
+        source="test_source",
+        cached=True,
+        load_time_seconds=1.5,
+        cache_path=Path("/tmp/cache"),
+        metadata={"key": "value"},
+    )
+
+    assert result.data == {"test": "data"}
+    assert result.source == "test_source"
+    assert result.cached is True
+    assert result.load_time_seconds == 1.5
+    assert result.cache_path == Path("/tmp/cache")
+    assert result.metadata == {"key": "value"}
+
+
+def test_オプショナル引数がデフォルト値になる():
+    result = DataLoadResult(
+        data={"test": "data"},
+        source="test_source",
+        cached=False,
+        load_time_seconds=1.0,
+    )
+
+    assert result.cache_path is None
+    assert result.metadata is None
+
+
+# --- DataLoadError / CacheError ---
+
+
+def test_エラーメッセージとソースが設定される():
+    error = DataLoadError("テストエラー", "test_source")
+
+    assert str(error) == "テストエラー"
+    assert error.source == "test_source"
+    assert error.original_error is None
+
+
+def test_元の例外が保持される():
+    error = DataLoadError("ラップされたエラー", "test_source", _SHARED_ORIGINAL)
+
+    assert error.original_error is _SHARED_ORIGINAL
+
+
+def test_CacheErrorが基本的な例外として動作する():
+    error = CacheError("キャッシュエラー")
+    assert str(error) == "キャッシュエラー"
+
+
+# --- BaseDataLoader: 初期化 ---
+
+
+def test_デフォルト設定で初期化される(loader_env):
+    loader = TestDataLoader()
+
+    assert loader.cache_enabled is True
+    assert loader.cache_ttl_hours == 24
+    assert loader.cache_dir == loader_env.cache_dir
+
+
+def test_カスタム設定で初期化される(loader_env):
+    custom_cache_dir = loader_env.cache_dir / "custom"
+    loader_env.cache_ttl_hours = 12
+
+    loader = TestDataLoader(
+        cache_enabled=False,
+        cache_ttl_hours=48,
+        cache_dir=custom_cache_dir,
+    )
+
+    assert loader.cache_enabled is False
+    assert loader.cache_ttl_hours == 48
+    assert loader.cache_dir == custom_cache_dir
+
+
+def test_キャッシュディレクトリが自動作成される(loader_env):
+    cache_dir = loader_env.cache_dir / "new_cache"
+    loader_env.cache_dir = cache_dir
+
+    TestDataLoader()
+
+    assert cache_dir.exists()
+
+
+# --- BaseDataLoader: データロード ---
+
+
+def test_ソースから正常にロードされる(loader_env):
+    loader = TestDataLoader()
+    result = loader.load_data("test_source", param="value")
+
+    assert isinstance(result, DataLoadResult)
+    assert result.source == "test_source"
+    assert result.cached is False
+    assert result.load_time_seconds > 0
+    assert "test" in result.data
+
+
+def test_実行時間が正確に計測される(loader_env, monkeypatch):
+    loader_env.cache_enabled = False
+    loader = TestDataLoader()
+
+    # 実際に待つ代わりに単調時計を制御し、差分を決定的に検証する
+    monkeypatch.setattr(
+        "compare_regions_jp.data.base.time.perf_counter",
+        Mock(side_effect=[0.0, 0.15]),
+    )
+    with patch.object(loader, "_load_data_from_source") as mock_load:
+        mock_load.return_value = {"test": "data"}
+        result = loader.load_data("test_source")
+
+        assert result.load_time_seconds == pytest.approx(0.15)
+
+
+@pytest.mark.parametrize(
+    ("source", "side_effect", "expected_message"),
+    [
+        # ソース側で送出されたDataLoadErrorはそのまま伝播する
+        ("error_source", None, "テストエラー"),
+        # 予期しない例外はDataLoadErrorでラップされる
+        ("test_source", ValueError("予期しないエラー"), "データロードに失敗しました"),
+    ],
+)
+def test_ロードエラーがDataLoadErrorとして伝播する(
+    loader_env, source, side_effect, expected_message
+):
+    loader_env.cache_enabled = False
+    loader = TestDataLoader()
+
+    if side_effect is not None:
+        loader._load_data_from_source = Mock(side_effect=side_effect)
+
+    with pytest.raises(DataLoadError) as exc_info:
+        loader.load_data(source)
+
+    assert exc_info.value.source == source
+    assert expected_message in str(exc_info.value)
+    if side_effect is not None:
+        assert exc_info.value.original_error is side_effect
+
+
+# --- BaseDataLoader: キャッシュ機能 ---
+
+
+def test_キャッシュが無効な場合は常にソースからロード(loader_env):
+    loader_env.cache_enabled = False
+    loader = TestDataLoader(cache_enabled=False)
+
+    # 最初のロード
+    result1 = loader.load_data("test_source")
+    assert result1.cached is False
+
+    # 2回目のロード
+    result2 = loader.load_data("test_source")
+    assert result2.cached is False
+
+    # ソースから2回ロードされている
+    assert loader.load_call_count == 2
+
+
+def test_キャッシュからデータがロードされる(loader_env):
+    loader = TestDataLoader()
+
+    # 最初のロード（キャッシュに保存）
+    result1 = loader.load_data("test_source")
+    assert result1.cached is False
+    assert loader.load_call_count == 1
+
+    # 2回目のロード（キャッシュから取得）
+    result2 = loader.load_data("test_source")
+    assert result2.cached is True
+    assert loader.load_call_count == 1  # ソースからは1回のみ
+
+
+def test_メモリキャッシュにより再読み込みが省略される(loader_env):
+    loader = TestDataLoader()
+
+    # 最初のロード（キャッシュ保存＋メモリキャッシュ投入）
+    loader.load_data("test_source")
+
+    # 2回目のロードはファイルを読まずメモリキャッシュから返る
+    with patch.object(loader, "_load_from_cache") as mock_load_cache:
+        result = loader.load_data("test_source")
+
+    assert result.cached is True
+    mock_load_cache.assert_not_called()
+
+
+def test_期限切れキャッシュは無視される(loader_env, monkeypatch):
+    loader = TestDataLoader(cache_ttl_hours=1)
+
+    # 最初のロード
+    loader.load_data("test_source")
+
+    # 実際に待つ代わりに時計をTTL超過分だけ進める
+    future = time.time() + 7200
+    monkeypatch.setattr("compare_regions_jp.data.base.time.time", lambda: future)
+
+    # 2回目のロード（期限切れなのでソースから）
+    result2 = loader.load_data("test_source")
+    assert result2.cached is False
+    assert loader.load_call_count == 2
+
+
+def test_キャッシュ読み込みエラーでソースからロード(loader_env):
+    loader = TestDataLoader()
+
+    # エラーを起こすキャッシュパスを作成
+    cache_path = loader._get_cache_path("error_cache_source")
+    cache_path.write_bytes(b"\x80\x05garbage")
+
+    # ロード（キャッシュエラーでソースから取得）
+    result = loader.load_data("error_cache_source")
+    assert result.cached is False
+
+
+def test_キャッシュ保存エラーでも処理が継続される(loader_env):
+    loader = TestDataLoader()
+
+    # キャッシュ保存でエラーが発生するソース
+    result = loader.load_data("error_save_source")
+
+    # エラーに関わらず結果は返される
+    assert result.cached is False
+    assert result.data is not None
+
+
+# --- BaseDataLoader: キャッシュパス生成 ---
+
+
+def test_キャッシュパスのユニーク性と決定性とファイル名規約(loader_env):
+    # 1つのローダーでまとめて検証し、セットアップを1回に抑える
+    loader = TestDataLoader()
+    inputs = [("source1", "a"), ("source2", "a"), ("source1", "b")]
+
+    paths = [loader._get_cache_path(source, param=p) for source, p in inputs]
+
+    # 異なる(source, param)の組は全て異なるパスになる
+    assert len(set(paths)) == len(paths)
+
+    # 同じ入力からは常に同じパスが生成される
+    for (source, p), path in zip(inputs, paths, strict=True):
+        assert loader._get_cache_path(source, param=p) == path
+
+    # ローダー名の接頭辞と拡張子の規約
+    for path in paths:
+        assert path.name.startswith("testdata_")
+        assert path.name.endswith(".cache")
+
+
+# --- BaseDataLoader: キャッシュ有効性判定 ---
+
+
+def test_存在しないファイルは無効(loader_env):
+    loader = TestDataLoader()
+    cache_path = loader_env.cache_dir / "nonexistent.cache"
+
+    assert loader._is_cache_valid(cache_path) is False
+
+
+def test_期限内のファイルは有効(loader_env):
+    loader = TestDataLoader()
+    cache_path = loader_env.cache_dir / "valid.cache"
+    cache_path.write_bytes(b"test")
+
+    assert loader._is_cache_valid(cache_path) is True
+
+
+def test_期限切れファイルは無効(loader_env, monkeypatch):
+    loader = TestDataLoader(cache_ttl_hours=1)
+    cache_path = loader_env.cache_dir / "expired.cache"
+    cache_path.write_bytes(b"test")
+
+    # 実際に待つ代わりに時計をTTL超過分だけ進める
+    future = time.time() + 7200
+    monkeypatch.setattr("compare_regions_jp.data.base.time.time", lambda: future)
+
+    assert loader._is_cache_valid(cache_path) is False
+
+
+# --- BaseDataLoader: キャッシュクリア ---
+
+
+def test_全体クリアが正常に動作する(populated_loader):
+    deleted_count = populated_loader.clear_cache()
+
+    assert deleted_count == 2
+
+
+def test_特定ソースのクリアが正常に動作する(populated_loader):
+    # 特定ソースをクリア
+    deleted_count = populated_loader.clear_cache("source1")
+
+    assert deleted_count == 1
+
+    # source2のキャッシュは残っている
+    result = populated_loader.load_data("source2")
+    assert result.cached is True
+
+
+def test_キャッシュ無効時はゼロが返される(loader_env):
+    loader_env.cache_enabled = False
+    loader = TestDataLoader(cache_enabled=False)
+    deleted_count = loader.clear_cache()
+
+    assert deleted_count == 0
+
+
+# --- BaseDataLoader: キャッシュ情報取得 ---
+
+
+def test_キャッシュ無効時の情報が正しく返される(loader_env):
+    loader_env.cache_enabled = False
+    loader = TestDataLoader(cache_enabled=False)
+    info = loader.get_cache_info()
+
+    assert info["enabled"] is False
+    assert info["file_count"] == 0
+    assert info["total_size_bytes"] == 0
+
+
+def test_キャッシュ有効時の詳細情報が返される(populated_loader):
+    info = populated_loader.get_cache_info()
+
+    assert info["enabled"] is True
+    assert info["file_count"] == 2
+    assert info["total_size_bytes"] > 0
+    assert len(info["files"]) == 2
+
+    # ファイル情報の確認
+    file_info = info["files"][0]
+    assert "path" in file_info
+    assert "size_bytes" in file_info
+    assert "modified_time" in file_info
+    assert "age_hours" in file_info
+    assert "valid" in file_info
+
+
+# --- BaseDataLoader: エラーハンドリング ---
+
+
+def test_デバッグモード時にキャッシュエラーが表示される(loader_env, monkeypatch):
+    loader_env.debug = True
+    loader = TestDataLoader()
+
+    # 遅延構築される共有Consoleのグローバルをモックへ差し替える
+    # （Consoleクラスをpatchすると初回構築で掴んだMockがグローバルに残留するため）
+    mock_console = Mock()
+    monkeypatch.setattr("compare_regions_jp.data.base._debug_console", mock_console)
+
+    loader._handle_cache_error("テストエラー")
+
+    mock_console.print.assert_called_once()
+
+
+def test_破損キャッシュファイルが削除される(loader_env):
+    loader = TestDataLoader()
+
+    # 破損したキャッシュファイルを作成
+    cache_path = loader_env.cache_dir / "corrupted.cache"
+    cache_path.write_bytes(b"corrupted data")
+
+    assert cache_path.exists()
+
+    loader._handle_cache_error("エラー", cache_path)
+
+    assert not cache_path.exists()
@@ -1,34 +1,19 @@
 """鉄道データローダーのテスト。"""
 
-import json
-import tempfile
+import io
+import os
+import time
 from pathlib import Path
-from unittest.mock import patch
-from urllib.error import URLError
+from unittest.mock import MagicMock, patch
 
 import geopandas as gpd
+import pandas as pd
 import pytest
+import requests
 from compare_regions_jp.data.base import CacheError, DataLoadError
 from compare_regions_jp.data.railway import RailwayDataLoader
 from shapely.geometry import Point
 
-# テストデータ
-SAMPLE_RAILWAY_DATA = {
-    "type": "FeatureCollection",
-    "features": [
-        {
-            "type": "Feature",
-            "properties": {"駅名": "渋谷", "着数1": 100, "発数1": 102},
-            "geometry": {"type": "Point", "coordinates": [139.7016, 35.6580]},
-        },
-        {
-            "type": "Feature",
-            "properties": {"駅名": "新宿", "着数1": 150, "発数1": 155},
-            "geometry": {"type": "Point", "coordinates": [139.7004, 35.6896]},
-        },
-    ],
-}
-
 
 class TestRailwayDataLoader:
     """鉄道データローダーのテストクラス。"""
@@ -47,28 +32,14 @@ class TestRailwayDataLoader:
         loader = RailwayDataLoader(cache_enabled=False)
         assert loader.cache_enabled is False
 
-    @patch("compare_regions_jp.data.railway.urlretrieve")
+    @patch("compare_regions_jp.data.railway.requests.get")
     @patch("compare_regions_jp.data.railway.gpd.read_file")
-    def test_load_data_from_source_success(self, mock_read_file, mock_urlretrieve):
+    def test_load_data_from_source_success(
+        self, mock_read_file, mock_get, sample_railway_gdf
+    ):
         """ソースからのデータロード成功のテスト。"""
         # モック設定
-        mock_gdf = gpd.GeoDataFrame(
-            [
-                {
-                    "駅名": "渋谷",
-                    "着数1": 100,
-                    "発数1": 102,
-                    "geometry": Point(139.7016, 35.6580),
-                },
-                {
-                    "駅名": "新宿",
-                    "着数1": 150,
-                    "発数1": 155,
-                    "geometry": Point(139.7004, 35.6896),
-                },
-            ]
-        )
-        mock_read_file.return_value = mock_gdf
+        mock_read_file.return_value = sample_railway_gdf
 
         loader = RailwayDataLoader()
         result = loader._load_data_from_source("https://example.com/data.geojson")
@@ -76,13 +47,13 @@ class TestRailwayDataLoader:
         # 検証
         assert isinstance(result, gpd.GeoDataFrame)
         assert len(result) == 2
-        mock_urlretrieve.assert_called_once()
+        mock_get.assert_called_once()
         mock_read_file.assert_called_once()
 
-    @patch("compare_regions_jp.data.railway.urlretrieve")
-    def test_load_data_from_source_network_error(self, mock_urlretrieve):
+    @patch("compare_regions_jp.data.railway.requests.get")
+    def test_load_data_from_source_network_error(self, mock_get):
         """ネットワークエラーのテスト。"""
-        mock_urlretrieve.side_effect = URLError("Network error")
+        mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
 
         loader = RailwayDataLoader()
         with pytest.raises(DataLoadError) as exc_info:
@@ -90,33 +61,26 @@ class TestRailwayDataLoader:
 
         assert "鉄道データの取得に失敗しました" in str(exc_info.value)
 
-    @patch("compare_regions_jp.data.railway.urlretrieve")
+    @patch("compare_regions_jp.data.railway.requests.get")
     @patch("compare_regions_jp.data.railway.gpd.read_file")
-    def test_load_data_from_source_with_bbox(self, mock_read_file, mock_urlretrieve):
+    def test_load_data_from_source_with_bbox(
+        self, mock_read_file, mock_get, sample_railway_gdf
+    ):
         """bboxフィルタリングのテスト。"""
-        # 元のGeoDataFrame（bbox外の駅も含む）
-        mock_gdf = gpd.GeoDataFrame(
+        # 共有フィクスチャにbbox外の駅を1行追加したGeoDataFrame
+        far_station = gpd.GeoDataFrame(
             [
-                {
-                    "駅名": "渋谷",
-                    "着数1": 100,
-                    "発数1": 102,
-                    "geometry": Point(139.7016, 35.6580),
-                },
-                {
-                    "駅名": "新宿",
-                    "着数1": 150,
-                    "発数1": 155,
-                    "geometry": Point(139.7004, 35.6896),
-                },
                 {
                     "駅名": "遠い駅",
                     "着数1": 50,
                     "発数1": 55,
                     "geometry": Point(140.0000, 36.0000),
-                },  # bbox外
+                }  # bbox外
             ]
         )
+        mock_gdf = gpd.GeoDataFrame(
+            pd.concat([sample_railway_gdf, far_station], ignore_index=True)
+        )
         mock_read_file.return_value = mock_gdf
 
         loader = RailwayDataLoader()
@@ -127,72 +91,54 @@ class TestRailwayDataLoader:
 
         # 検証：データが読み込まれることを確認（実際のフィルタリングはGeoPandasの機能に依存）
         assert isinstance(result, gpd.GeoDataFrame)
-        mock_urlretrieve.assert_called_once()
+        mock_get.assert_called_once()
         mock_read_file.assert_called_once()
 
-    def test_save_to_cache(self):
+    def test_save_to_cache(self, sample_railway_gdf):
         """キャッシュ保存のテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_path = Path(temp_dir) / "test_cache.geojson"
-
-            # テストデータ作成
-            gdf = gpd.GeoDataFrame(
-                [
-                    {
-                        "駅名": "渋谷",
-                        "着数1": 100,
-                        "発数1": 102,
-                        "geometry": Point(139.7016, 35.6580),
-                    }
-                ]
-            )
-
-            loader = RailwayDataLoader()
-            loader._save_to_cache(gdf, cache_path)
-
-            # 検証
-            assert cache_path.exists()
-            loaded_gdf = gpd.read_file(cache_path)
-            assert len(loaded_gdf) == 1
-            assert loaded_gdf.iloc[0]["駅名"] == "渋谷"
-
-    def test_save_to_cache_error(self):
+        # ディスクを介さずメモリ上のバッファへ保存する
+        buffer = io.BytesIO()
+
+        loader = RailwayDataLoader()
+        loader._save_to_cache(sample_railway_gdf, buffer)
+
+        # 検証（GeoParquet形式で保存される）
+        buffer.seek(0)
+        loaded_gdf = gpd.read_parquet(buffer)
+        assert len(loaded_gdf) == 2
+        assert loaded_gdf.iloc[0]["駅名"] == "渋谷"
+
+    def test_save_to_cache_error(self, sample_railway_gdf):
         """キャッシュ保存エラーのテスト。"""
         # 存在しないディレクトリのパス
-        cache_path = Path("/nonexistent/path/cache.geojson")
-
-        gdf = gpd.GeoDataFrame(
-            [{"駅名": "渋谷", "着数1": 100, "発数1": 102, "geometry": Point(139.7016, 35.6580)}]
-        )
+        cache_path = Path("/nonexistent/path/cache.cache")
 
         loader = RailwayDataLoader()
         with pytest.raises(CacheError) as exc_info:
-            loader._save_to_cache(gdf, cache_path)
+            loader._save_to_cache(sample_railway_gdf, cache_path)
 
         assert "キャッシュ保存に失敗しました" in str(exc_info.value)
 
-    def test_load_from_cache(self):
+    def test_load_from_cache(self, sample_railway_gdf):
         """キャッシュ読み込みのテスト。"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache_path = Path(temp_dir) / "test_cache.geojson"
+        # テストデータをメモリ上のGeoParquetとして用意
+        buffer = io.BytesIO()
+        sample_railway_gdf.to_parquet(buffer)
+        buffer.seek(0)
 
-            # テストデータをファイルに保存
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(SAMPLE_RAILWAY_DATA, f, ensure_ascii=False)
-
-            loader = RailwayDataLoader()
-            result = loader._load_from_cache(cache_path)
+        loader = RailwayDataLoader()
+        result = loader._load_from_cache(buffer)
 
-            # 検証
-            assert isinstance(result, gpd.GeoDataFrame)
-            assert len(result) == 2
-            assert result.iloc[0]["駅名"] == "渋谷"
-            assert result.iloc[1]["駅名"] == "新宿"
+        # 検証
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert len(result) == 2
+        assert result.iloc[0]["駅名"] == "渋谷"
+        assert result.iloc[1]["駅名"] == "新宿"
 
     def test_load_from_cache_error(self):
         """キャッシュ読み込みエラーのテスト。"""
         # 存在しないファイル
-        cache_path = Path("/nonexistent/file.geojson")
+        cache_path = Path("/nonexistent/file.cache")
 
         loader = RailwayDataLoader()
         with pytest.raises(CacheError) as exc_info:
@@ -200,14 +146,40 @@ class TestRailwayDataLoader:
 
         assert "キャッシュ読み込みに失敗しました" in str(exc_info.value)
 
-    @patch("compare_regions_jp.data.railway.urlretrieve")
+    @patch("compare_regions_jp.data.railway.requests.get")
+    def test_load_data_not_modified_reuses_expired_cache(
+        self, mock_get, tmp_path, sample_railway_gdf
+    ):
+        """304応答で期限切れキャッシュが再利用されるテスト。"""
+        loader = RailwayDataLoader(cache_dir=tmp_path)
+
+        # 期限切れキャッシュとETagサイドカーを用意
+        cache_path = loader._get_cache_path(loader.data_url)
+        sample_railway_gdf.to_parquet(cache_path)
+        cache_path.with_suffix(".etag").write_text('"abc123"')
+        expired = time.time() - (loader.cache_ttl_hours + 1) * 3600
+        os.utime(cache_path, (expired, expired))
+
+        # 条件付きGETに304を返すモック
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        result = loader.load_data(loader.data_url)
+
+        # 検証：If-None-Matchが送信され、キャッシュが再利用・延命される
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc123"'}
+        assert result.cached is True
+        assert len(result.data) == 2
+        assert cache_path.stat().st_mtime > expired + 3600
+
+    @patch("compare_regions_jp.data.railway.requests.get")
     @patch("compare_regions_jp.data.railway.gpd.read_file")
-    def test_load_railway_data_integration(self, mock_read_file, mock_urlretrieve):
+    def test_load_railway_data_integration(
+        self, mock_read_file, mock_get, sample_railway_gdf
+    ):
         """load_railway_dataメソッドの統合テスト。"""
-        mock_gdf = gpd.GeoDataFrame(
-            [{"駅名": "渋谷", "着数1": 100, "発数1": 102, "geometry": Point(139.7016, 35.6580)}]
-        )
-        mock_read_file.return_value = mock_gdf
+        mock_read_file.return_value = sample_railway_gdf
 
         loader = RailwayDataLoader(cache_enabled=False)  # キャッシュ無効でテスト
         result = loader.load_railway_data()
@@ -218,14 +190,13 @@ class TestRailwayDataLoader:
         assert result.cached is False
         assert result.load_time_seconds >= 0
 
-    @patch("compare_regions_jp.data.railway.urlretrieve")
+    @patch("compare_regions_jp.data.railway.requests.get")
     @patch("compare_regions_jp.data.railway.gpd.read_file")
-    def test_load_railway_data_with_bbox(self, mock_read_file, mock_urlretrieve):
+    def test_load_railway_data_with_bbox(
+        self, mock_read_file, mock_get, sample_railway_gdf
+    ):
         """bboxありでのload_railway_dataメソッドのテスト。"""
-        mock_gdf = gpd.GeoDataFrame(
-            [{"駅名": "渋谷", "着数1": 100, "発数1": 102, "geometry": Point(139.7016, 35.6580)}]
-        )
-        mock_read_file.return_value = mock_gdf
+        mock_read_file.return_value = sample_railway_gdf
 
         loader = RailwayDataLoader(cache_enabled=False)
         bbox = (139.69, 35.65, 139.71, 35.70)
@@ -234,5 +205,5 @@ class TestRailwayDataLoader:
         # 検証
         assert result.data is not None
         assert isinstance(result.data, gpd.GeoDataFrame)
-        mock_urlretrieve.assert_called_once()
+        mock_get.assert_called_once()
         mock_read_file.assert_called_once()
@@ -15,7 +15,7 @@ from shapely.geometry import Point
 
 def describe_データ管理():
     def describe_キャッシュ機能():
-        @patch("compare_regions_jp.cli.RailwayDataLoader")
+        @patch("compare_regions_jp.data.railway.RailwayDataLoader")
         def RailwayDataLoaderを使用してデータ取得(mock_loader_class: Mock) -> None:
             mock_loader = Mock()
             mock_result = Mock()
@@ -52,6 +52,28 @@ def describe_駅検索():
         assert len(result) == 1
         assert result.iloc[0]["駅名"] == "東京"
 
+    def スライスしたフレームでも検索できる():
+        gdf = gpd.GeoDataFrame(
+            {
+                "駅名": ["東京", "新宿", "渋谷"],
+                "geometry": [
+                    Point(139.7, 35.7),
+                    Point(139.7, 35.7),
+                    Point(139.7, 35.7),
+                ],
+            }
+        )
+
+        # 親フレームでの検索により駅名インデックスがattrsにキャッシュされる
+        find_station(gdf, "渋谷")
+
+        # スライスはattrsごと引き継ぐため、親の行位置を誤用しないこと
+        subset = gdf.iloc[1:]
+        result = find_station(subset, "渋谷")
+
+        assert len(result) == 1
+        assert result.iloc[0]["駅名"] == "渋谷"
+
     def 存在しない駅名でエラー終了():
         gdf = gpd.GeoDataFrame(
             {"駅名": ["東京", "新宿"], "geometry": [Point(139.7, 35.7), Point(139.7, 35.7)]}
@@ -73,6 +95,21 @@ def describe_矩形計算():
         assert miny == 34.95
         assert maxy == 35.05
 
+    def 配列入力で複数の境界ボックスを一括計算():
+        import numpy as np
+
+        lats = np.array([35.0, 36.0])
+        lons = np.array([139.0, 140.0])
+
+        minx, miny, maxx, maxy = calculate_bounding_box(lats, lons, 0.1, 0.1)
+
+        # 各要素がスカラー呼び出しと同じ結果になる
+        for i in range(len(lats)):
+            expected = calculate_bounding_box(
+                float(lats[i]), float(lons[i]), 0.1, 0.1
+            )
+            assert (minx[i], miny[i], maxx[i], maxy[i]) == expected
+
 
 def describe_本数集計():
     def エリア内駅の運行本数を正しく合計():
@@ -101,6 +138,35 @@ def describe_本数集計():
         assert departures == 200  # 60 + 140
         assert total == 300  # 100 + 200
 
+    def スライスしたフレームでも正しく集計できる():
+        gdf = gpd.GeoDataFrame(
+            {
+                "駅名": ["A駅", "B駅", "C駅"],
+                "着数1": [10, 20, 5],
+                "発数1": [15, 25, 10],
+                "着数2": [30, 40, 15],
+                "発数2": [45, 115, 20],
+                "geometry": [
+                    Point(139.0, 35.0),
+                    Point(139.01, 35.01),
+                    Point(140.0, 36.0),
+                ],
+            }
+        )
+        bbox = (138.99, 34.99, 139.02, 35.02)
+
+        # 親フレームでの集計により本数行列・座標配列がattrsにキャッシュされる
+        count_stations_in_area(gdf, bbox)
+
+        # スライスはattrsごと引き継ぐため、親の全長配列を誤用しないこと
+        subset = gdf.iloc[1:]
+        arrivals, departures, total = count_stations_in_area(subset, bbox)
+
+        # B駅のみ: 着=20+40=60, 発=25+115=140, 計=200
+        assert arrivals == 60
+        assert departures == 140
+        assert total == 200
+
     def 本数データがない場合は0として扱う():
         gdf = gpd.GeoDataFrame({"駅名": ["A駅"], "geometry": [Point(139.0, 35.0)]})
         bbox = (138.99, 34.99, 139.01, 35.01)
@@ -113,7 +179,7 @@ def describe_本数集計():
 
 
 def describe_CLI():
-    @patch("compare_regions_jp.cli.RailwayDataLoader")
+    @patch("compare_regions_jp.data.railway.RailwayDataLoader")
     def 必須引数が全て提供された場合に正常実行(mock_loader_class: Mock) -> None:
         mock_loader = Mock()
         mock_result = Mock()
@@ -142,7 +208,7 @@ def describe_CLI():
 
 
 def describe_ダウンロード():
-    @patch("compare_regions_jp.cli.RailwayDataLoader")
+    @patch("compare_regions_jp.data.railway.RailwayDataLoader")
     def RailwayDataLoaderでダウンロード処理(mock_loader_class: Mock) -> None:
         mock_loader = Mock()
         mock_result = Mock()